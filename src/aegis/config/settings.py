@@ -556,6 +556,16 @@ class GPUSettings(BaseSettings):
         default="cuda",
         description="GPU device type: 'cuda', 'rocm', or 'mps'",
     )
+    node_cache_ttl_seconds: float = Field(
+        default=30.0,
+        description="Seconds to reuse the last GPU node detection result",
+        ge=0.0,
+    )
+    unavailable_cache_ttl_seconds: float = Field(
+        default=600.0,
+        description="Seconds to skip GPU node detection after kubeconfig loading fails",
+        ge=0.0,
+    )
 
 
 class AgentSettings(BaseSettings):
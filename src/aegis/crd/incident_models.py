@@ -297,7 +297,7 @@ class AegisIncident(BaseModel):
         resource_ref_data = spec_data.get("resourceRef", {})
 
         spec = IncidentSpec(
-            source=spec_data.get("source", "k8sgpt"),
+            source=spec_data.get("source", IncidentSource.K8SGPT),
             resource_ref=ResourceRef(
                 kind=resource_ref_data.get("kind", ""),
                 name=resource_ref_data.get("name", ""),
@@ -305,7 +305,7 @@ class AegisIncident(BaseModel):
             ),
             errors=spec_data.get("errors", []),
             k8sgpt_analysis=spec_data.get("k8sgptAnalysis"),
-            severity=spec_data.get("severity", "medium"),
+            severity=spec_data.get("severity", IncidentSeverity.MEDIUM),
         )
 
         # Parse RCA result if present
@@ -327,7 +327,7 @@ class AegisIncident(BaseModel):
         # Parse status
         status_data = obj.get("status", {})
         status = IncidentStatus(
-            phase=status_data.get("phase", "Detected"),
+            phase=status_data.get("phase", IncidentPhase.DETECTED),
             fix_applied=status_data.get("fixApplied", False),
         )
         if "fixAppliedAt" in status_data:
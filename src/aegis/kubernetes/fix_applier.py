@@ -19,7 +19,7 @@ import contextlib
 import json
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, assert_never
+from typing import Any, ClassVar
 
 from kubernetes import client
 from kubernetes import config as k8s_config
@@ -64,6 +64,16 @@ class FixApplier:
         custom_api: Kubernetes CustomObjectsApi client
     """
 
+    # Fix type -> handler method; every handler takes (fix_proposal, kind, name, namespace)
+    _HANDLERS: ClassVar[dict[FixType, str]] = {
+        FixType.RESTART: "_apply_restart",
+        FixType.SCALE: "_apply_scale",
+        FixType.ROLLBACK: "_apply_rollback",
+        FixType.RESOURCE_ADJUSTMENT: "_apply_resource_adjustment",
+        FixType.CONFIG_CHANGE: "_apply_config_change",
+        FixType.PATCH: "_apply_patch",
+    }
+
     def __init__(self) -> None:
         """Initialize the FixApplier with Kubernetes clients."""
         try:
@@ -102,32 +112,15 @@ class FixApplier:
 
         result = FixResult(success=False)
 
-        try:
-            # Route to appropriate handler based on fix type
-            if fix_proposal.fix_type == FixType.RESTART:
-                result = await self._apply_restart(resource_kind, resource_name, namespace)
-            elif fix_proposal.fix_type == FixType.SCALE:
-                result = await self._apply_scale(
-                    fix_proposal, resource_kind, resource_name, namespace
-                )
-            elif fix_proposal.fix_type == FixType.ROLLBACK:
-                result = await self._apply_rollback(resource_kind, resource_name, namespace)
-            elif fix_proposal.fix_type == FixType.RESOURCE_ADJUSTMENT:
-                result = await self._apply_resource_adjustment(
-                    fix_proposal, resource_kind, resource_name, namespace
-                )
-            elif fix_proposal.fix_type == FixType.CONFIG_CHANGE:
-                result = await self._apply_config_change(
-                    fix_proposal, resource_kind, resource_name, namespace
-                )
-            elif fix_proposal.fix_type == FixType.PATCH:
-                result = await self._apply_patch(
-                    fix_proposal, resource_kind, resource_name, namespace
-                )
-            else:
-                # All FixType values handled above; this branch is for type safety
-                assert_never(fix_proposal.fix_type)
+        handler_name = self._HANDLERS.get(fix_proposal.fix_type)
+        if handler_name is None:
+            result.error_message = f"Unsupported fix type: {fix_proposal.fix_type}"
+            log.error("unsupported_fix_type", fix_type=str(fix_proposal.fix_type))
+            return result
 
+        try:
+            handler = getattr(self, handler_name)
+            result = await handler(fix_proposal, resource_kind, resource_name, namespace)
         except client.ApiException as e:
             result.error_message = f"Kubernetes API error: {e.reason}"
             log.exception("fix_application_failed", error=e.reason)
@@ -139,6 +132,7 @@ class FixApplier:
 
     async def _apply_restart(
         self,
+        fix_proposal: FixProposal,
         resource_kind: str,
         resource_name: str,
         namespace: str,
@@ -147,6 +141,7 @@ class FixApplier:
 
         This triggers a rolling restart without changing the actual configuration.
         """
+        del fix_proposal
         result = FixResult(success=False)
 
         restart_annotation = "aegis.io/restartedAt"
@@ -392,11 +387,13 @@ class FixApplier:
 
     async def _apply_rollback(
         self,
+        fix_proposal: FixProposal,
         resource_kind: str,
         resource_name: str,
         namespace: str,
     ) -> FixResult:
         """Apply a rollback to previous revision."""
+        del fix_proposal
         result = FixResult(success=False)
 
         if resource_kind.lower() not in ["deployment", "deployments"]:
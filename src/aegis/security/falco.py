@@ -14,9 +14,12 @@ Design goals:
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import math
+import re
 import shutil
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -26,9 +29,23 @@ from aegis.observability._logging import get_logger
 
 log = get_logger(__name__)
 
+# orjson is installed alongside langsmith; fall back to stdlib json without it.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both.
+try:
+    import orjson
+
+    _json_loads: Callable[[str], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Default timeout for kubectl logs command
 DEFAULT_FALCO_TIMEOUT_SECONDS = 30
 
+# Lines longer than this are dropped individually (Falco JSON lines can be long)
+FALCO_LOG_LINE_LIMIT_BYTES = 1024 * 1024
+# Pipe read size used when streaming kubectl logs
+FALCO_LOG_READ_CHUNK_BYTES = 64 * 1024
+
 # Falco priority levels in order (highest to lowest)
 FALCO_PRIORITY_ORDER = [
     "EMERGENCY",
@@ -45,16 +62,12 @@ FALCO_PRIORITY_ORDER = [
 PRIORITY_LEVELS = {p: i for i, p in enumerate(FALCO_PRIORITY_ORDER)}
 
 
+@functools.lru_cache(maxsize=32)
 def _get_priority_level(priority: str) -> int:
-    """Get numeric priority level (lower = more severe)."""
+    """Get numeric priority level (lower = more severe), memoized per raw spelling."""
     return PRIORITY_LEVELS.get(priority.upper(), len(FALCO_PRIORITY_ORDER))
 
 
-def _meets_severity_threshold(priority: str, threshold: str) -> bool:
-    """Check if priority meets or exceeds threshold (more severe = lower number)."""
-    return _get_priority_level(priority) <= _get_priority_level(threshold)
-
-
 def _extract_namespace_from_event(event: dict[str, Any] | str) -> str | None:
     """Extract namespace from a Falco event (JSON dict or raw string)."""
     if isinstance(event, dict):
@@ -100,20 +113,31 @@ def _parse_falco_line(line: str) -> dict[str, Any] | str:
         return ""
 
     try:
-        parsed = json.loads(line)
+        parsed = _json_loads(line)
     except json.JSONDecodeError:
         return line
     return parsed if isinstance(parsed, dict) else line
 
 
+@functools.lru_cache(maxsize=64)
+def _namespace_pattern(namespace: str) -> re.Pattern[str]:
+    """Compile a matcher for ``namespace`` as a whole DNS label inside free text."""
+    return re.compile(rf"(?<![a-z0-9-]){re.escape(namespace)}(?![a-z0-9-])")
+
+
 def _matches_namespace(event: dict[str, Any] | str, namespace: str) -> bool:
     """Return True if event is associated with a given Kubernetes namespace."""
+    if not namespace:
+        return True
     if isinstance(event, dict):
         event_ns = _extract_namespace_from_event(event)
         if event_ns == namespace:
             return True
-        return namespace in str(event.get("output", ""))
-    return namespace in str(event)
+        text = str(event.get("output", ""))
+    else:
+        text = str(event)
+    # Whole-label match so "shadow-1" does not pick up alerts for "shadow-10"
+    return _namespace_pattern(namespace).search(text) is not None
 
 
 def _priority_from_event(event: dict[str, Any] | str) -> str:
@@ -156,14 +180,21 @@ def _filter_alerts(
         "warning": 0,
         "other": 0,
     }
+    # Resolved once; per line only the alert's own level is looked up
+    threshold_level = _get_priority_level(severity_threshold)
 
     for line in lines:
+        # Every _matches_namespace path needs the namespace verbatim in the raw line,
+        # so lines without it can be dropped before paying for a JSON decode.
+        if namespace not in line:
+            continue
         parsed = _parse_falco_line(line)
         if not parsed or not _matches_namespace(parsed, namespace):
             continue
 
         priority = _priority_from_event(parsed)
-        if priority and not _meets_severity_threshold(priority, severity_threshold):
+        # Lower level = more severe; keep alerts at or above the threshold
+        if priority and _get_priority_level(priority) > threshold_level:
             continue
 
         summary[_summary_bucket(priority)] += 1
@@ -172,6 +203,71 @@ def _filter_alerts(
     return filtered, summary
 
 
+async def _collect_log_lines(
+    proc: asyncio.subprocess.Process,
+    namespace: str,
+) -> tuple[int, int, list[str], bytes]:
+    """Stream kubectl stdout line by line, keeping only lines that mention ``namespace``.
+
+    Lines over ``FALCO_LOG_LINE_LIMIT_BYTES`` are dropped on their own; reading continues.
+
+    Returns:
+        Tuple of (non_empty_line_count, dropped_line_count, candidate_lines, stderr)
+    """
+
+    count = 0
+    dropped = 0
+    candidates: list[str] = []
+
+    def _take(raw: bytes) -> None:
+        nonlocal count, dropped
+        if len(raw) > FALCO_LOG_LINE_LIMIT_BYTES:
+            dropped += 1
+            return
+        line = raw.decode(errors="replace").strip()
+        if not line:
+            return
+        count += 1
+        # Same necessary condition as _filter_alerts; avoids holding the whole dump
+        if namespace in line:
+            candidates.append(line)
+
+    async def _stdout() -> None:
+        nonlocal dropped
+        if proc.stdout is None:
+            return
+        pending = b""
+        # Inside an oversized line: discard bytes until its terminating newline
+        discarding = False
+        while chunk := await proc.stdout.read(FALCO_LOG_READ_CHUNK_BYTES):
+            *complete, pending = (pending + chunk).split(b"\n")
+            for raw in complete:
+                if discarding:
+                    discarding = False
+                    continue
+                _take(raw)
+            if len(pending) > FALCO_LOG_LINE_LIMIT_BYTES:
+                if not discarding:
+                    dropped += 1
+                pending = b""
+                discarding = True
+        if pending and not discarding:
+            _take(pending)
+
+    async def _stderr() -> bytes:
+        return await proc.stderr.read() if proc.stderr is not None else b""
+
+    _, stderr = await asyncio.gather(_stdout(), _stderr())
+    await proc.wait()
+    if dropped:
+        log.warning(
+            "falco_log_lines_dropped",
+            count=dropped,
+            limit_bytes=FALCO_LOG_LINE_LIMIT_BYTES,
+        )
+    return count, dropped, candidates, stderr
+
+
 async def check_falco_alerts(
     namespace: str,
     since_timestamp: datetime,
@@ -198,7 +294,7 @@ async def check_falco_alerts(
     Returns:
         Dict with:
         - tool: "falco"
-        - passed: bool (False if alerts found, True otherwise)
+        - passed: bool (False if alerts found or lines dropped, True otherwise)
         - skipped: bool (True if check was skipped)
         - reason: str | None (reason for skip or failure)
         - namespace_filter: str (shadow namespace filtered)
@@ -211,6 +307,7 @@ async def check_falco_alerts(
         - summary: dict (counts by severity category)
         - alerts: list (filtered alerts)
         - raw_lines_count: int
+        - dropped_lines_count: int (oversized lines that could not be inspected)
         - stderr: str | None
     """
     result: dict[str, Any] = {
@@ -228,6 +325,7 @@ async def check_falco_alerts(
         "summary": {"critical": 0, "error": 0, "warning": 0, "other": 0},
         "alerts": [],
         "raw_lines_count": 0,
+        "dropped_lines_count": 0,
         "stderr": None,
     }
 
@@ -281,7 +379,9 @@ async def check_falco_alerts(
     )
 
     try:
-        stdout = b""
+        raw_lines_count = 0
+        dropped_lines_count = 0
+        candidate_lines: list[str] = []
         stderr = b""
         returncode = 1
         used_selector = selector_candidates[0]
@@ -305,8 +405,13 @@ async def check_falco_alerts(
             )
 
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    proc.communicate(),
+                (
+                    raw_lines_count,
+                    dropped_lines_count,
+                    candidate_lines,
+                    stderr,
+                ) = await asyncio.wait_for(
+                    _collect_log_lines(proc, namespace),
                     timeout=timeout_seconds,
                 )
             except TimeoutError:
@@ -351,12 +456,10 @@ async def check_falco_alerts(
             )
             return result
 
-        # Parse stdout
-        stdout_text = stdout.decode(errors="replace") if stdout else ""
-        lines = stdout_text.strip().split("\n") if stdout_text.strip() else []
-        result["raw_lines_count"] = len(lines)
+        result["raw_lines_count"] = raw_lines_count
+        result["dropped_lines_count"] = dropped_lines_count
 
-        if not lines or (len(lines) == 1 and not lines[0].strip()):
+        if not raw_lines_count and not dropped_lines_count:
             # No logs - Falco might not have any output yet
             log.info(
                 "falco_check_no_logs",
@@ -366,7 +469,7 @@ async def check_falco_alerts(
             return result
 
         # Filter alerts by namespace and severity
-        filtered_alerts, summary = _filter_alerts(lines, namespace, severity_threshold)
+        filtered_alerts, summary = _filter_alerts(candidate_lines, namespace, severity_threshold)
 
         result["alerts"] = filtered_alerts
         result["alert_count"] = len(filtered_alerts)
@@ -384,11 +487,23 @@ async def check_falco_alerts(
                 alert_count=len(filtered_alerts),
                 summary=summary,
             )
+        elif dropped_lines_count:
+            # Oversized lines may hide alerts (command lines are attacker-controlled): fail closed
+            result["passed"] = False
+            result["reason"] = (
+                f"Dropped {dropped_lines_count} Falco log line(s) over "
+                f"{FALCO_LOG_LINE_LIMIT_BYTES} bytes; alerts cannot be ruled out"
+            )
+            log.warning(
+                "falco_check_lines_unverified",
+                namespace=namespace,
+                dropped_lines_count=dropped_lines_count,
+            )
         else:
             log.info(
                 "falco_check_passed",
                 namespace=namespace,
-                raw_lines_count=len(lines),
+                raw_lines_count=raw_lines_count,
                 filtered_count=0,
             )
 
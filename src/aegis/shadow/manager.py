@@ -16,6 +16,7 @@ import asyncio
 import base64
 import contextlib
 import copy
+import math
 import os
 import re
 import shlex
@@ -25,16 +26,18 @@ import subprocess
 import tempfile
 import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, cast
 from urllib.parse import urlparse
 
 import urllib3
 import yaml
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
 
@@ -82,6 +85,11 @@ DEFAULT_SMOKE_PATHS = ["/health", "/ready", "/healthz", "/readyz"]
 SMOKE_TEST_TIMEOUT_SECONDS = 180
 ROLLOUT_TIMEOUT_SECONDS = 600  # 10 minutes for pod rollout
 JOB_POLL_INTERVAL_SECONDS = 2
+# Job watches run in bounded slices so a cancelled wait frees its thread quickly
+JOB_WATCH_SLICE_SECONDS = 30
+JOB_WATCH_THREAD_PREFIX = "aegis-job-watch"
+# Client-side read timeout margin over the server-side watch timeout
+JOB_WATCH_REQUEST_SLACK_SECONDS = 5
 CURL_CONNECT_TIMEOUT_SECONDS = 10
 CURL_MAX_TIME_SECONDS = 30
 JOB_ACTIVE_DEADLINE_SECONDS = 180
@@ -92,6 +100,37 @@ KUBECTL_SET_IMAGE_MIN_ARGS = 4
 KUBECTL_REQUEST_TIMEOUT_SECONDS = 12
 KUBECTL_COMMAND_TIMEOUT_SECONDS = 25
 KUBECTL_CONNECTIVITY_RETRIES = 1
+LOCUST_FAILURE_RATE_RE = re.compile(r"\((\d+\.?\d*)%\)")
+SMOKE_TEST_SCRIPT = (
+    "set -e\n"
+    "for path in $SMOKE_PATHS; do\n"
+    '  echo "SMOKE_CHECK ${path}"\n'
+    f"  curl -fsS --connect-timeout {CURL_CONNECT_TIMEOUT_SECONDS} "
+    f'--max-time {CURL_MAX_TIME_SECONDS} "${{TARGET_BASE}}${{path}}" >/dev/null\n'
+    "done\n"
+    'echo "SMOKE_OK"\n'
+)
+LOCUSTFILE_TEMPLATE = (
+    "from locust import HttpUser, task, between\n"
+    "\n"
+    "class AegisUser(HttpUser):\n"
+    "    wait_time = between(0.1, 0.5)\n"
+    "\n"
+    "    @task\n"
+    "    def hit(self):\n"
+    "        self.client.get({path!r}, timeout={timeout})"
+)
+LOAD_TEST_COMMAND_TEMPLATE = (
+    "cat << 'PY' > /tmp/locustfile.py\n"
+    "{locustfile}\n"
+    "PY\n"
+    "locust -f /tmp/locustfile.py --headless "
+    "-u {users} -r {spawn_rate} -t {duration}s "
+    "--host {host}\n"
+)
+# Keep-alive pool per ApiClient; sized to cover concurrent asyncio.to_thread API calls
+# so connections are reused instead of discarded (and re-handshaked) under load.
+K8S_CONNECTION_POOL_MAXSIZE = 32
 KUBESEC_SUPPORTED_KINDS = {
     "Deployment",
     "StatefulSet",
@@ -106,6 +145,8 @@ KUBESEC_SUPPORTED_KINDS = {
 SHADOW_LABEL_KEY = "aegis.io/shadow"
 SHADOW_MANAGED_BY_LABEL = "aegis.io/managed-by"
 SHADOW_ID_ANNOTATION = "aegis.io/shadow-id"
+SHADOW_ID_LABEL = "aegis.io/shadow-id"
+JOB_NAME_LABEL = "job-name"
 SHADOW_SOURCE_NAMESPACE_ANNOTATION = "aegis.io/source-namespace"
 SHADOW_SOURCE_NAME_ANNOTATION = "aegis.io/source-name"
 SHADOW_SOURCE_KIND_ANNOTATION = "aegis.io/source-kind"
@@ -150,6 +191,21 @@ class ShadowEnvironment:
     kubeconfig_path: str | None = None
     _port_forward_proc: Any | None = None  # Stores the process object
 
+    @cached_property
+    def shadow_label_selector(self) -> str:
+        """Label selector matching resources tagged with this shadow id."""
+        return f"{SHADOW_ID_LABEL}={self.id}"
+
+    @cached_property
+    def app_label_selector(self) -> str:
+        """Label selector matching pods of the source workload (`app=<name>`)."""
+        return f"app={self.source_resource}"
+
+    @staticmethod
+    def job_label_selector(job_name: str) -> str:
+        """Label selector matching pods created by a Job."""
+        return f"{JOB_NAME_LABEL}={job_name}"
+
 
 @dataclass
 class ShadowClients:
@@ -169,6 +225,13 @@ class ShadowManager:
         """Initialize shadow manager with Kubernetes clients."""
         self._environments: dict[str, ShadowEnvironment] = {}
         self._shadow_clients: dict[str, ShadowClients] = {}
+        # Per-shadow image resolution, shared by concurrent callers; reset on changes.
+        self._image_cache: dict[str, asyncio.Task[list[str]]] = {}
+        # Blocking job watches get their own pool so they never starve _call_api users.
+        self._job_watch_executor = ThreadPoolExecutor(
+            max_workers=settings.shadow.max_concurrent_shadows,
+            thread_name_prefix=JOB_WATCH_THREAD_PREFIX,
+        )
 
         # Host cluster client (source of truth)
         self._host_api_client = self._load_api_client(
@@ -358,11 +421,7 @@ class ShadowManager:
             env.logs.append(f"Host namespace {shadow_namespace} created")
 
             # Create vCluster
-            await self._call_api(
-                self._vcluster_manager.create,
-                env.id,
-                shadow_namespace,
-            )
+            await self._vcluster_manager.create(env.id, shadow_namespace)
             env.logs.append("vCluster created")
 
             # Wait for vCluster resources to be ready
@@ -1103,7 +1162,7 @@ class ShadowManager:
                         "name": deployment.metadata.name,
                         "namespace": deployment.metadata.namespace,
                     },
-                    "spec": client.ApiClient().sanitize_for_serialization(deployment.spec),
+                    "spec": self._host_api_client.sanitize_for_serialization(deployment.spec),
                 }
                 manifests.append(yaml.safe_dump(manifest_dict))
         except ApiException as e:
@@ -1124,7 +1183,7 @@ class ShadowManager:
                             "name": service.metadata.name,
                             "namespace": service.metadata.namespace,
                         },
-                        "spec": client.ApiClient().sanitize_for_serialization(service.spec),
+                        "spec": self._host_api_client.sanitize_for_serialization(service.spec),
                     }
                     manifests.append(yaml.safe_dump(manifest_dict))
         except ApiException as e:
@@ -1198,6 +1257,7 @@ class ShadowManager:
             self._record_environment_error(env, shadow_error)
         finally:
             self._dispose_shadow_clients(env.id)
+            self._image_cache.pop(env.id, None)
 
     def get_environment(self, shadow_id: str) -> ShadowEnvironment | None:
         """Get shadow environment by ID."""
@@ -1547,6 +1607,7 @@ class ShadowManager:
     ) -> client.ApiClient:
         """Load Kubernetes config into a dedicated ApiClient."""
         config_obj = client.Configuration()
+        config_obj.connection_pool_maxsize = K8S_CONNECTION_POOL_MAXSIZE
         use_in_cluster = settings.kubernetes.in_cluster if in_cluster is None else in_cluster
         if use_in_cluster:
             config.load_incluster_config(client_configuration=config_obj)
@@ -1719,9 +1780,7 @@ class ShadowManager:
 
         if kubeconfig is None:
             try:
-                kubeconfig = await self._call_api(
-                    self._vcluster_manager.get_kubeconfig, name, namespace
-                )
+                kubeconfig = await self._vcluster_manager.get_kubeconfig(name, namespace)
                 log.info("vcluster_kubeconfig_loaded", source="cli", shadow=name)
             except RuntimeError as e:
                 log.exception(
@@ -2100,7 +2159,7 @@ class ShadowManager:
                 details={"shadow_id": env.id},
             )
 
-        await self._call_api(self._vcluster_manager.delete, env.id, env.host_namespace)
+        await self._vcluster_manager.delete(env.id, env.host_namespace)
         await self._delete_namespace(env.host_namespace, core_api=self._core_api)
 
         if env.kubeconfig_path:
@@ -2909,8 +2968,7 @@ class ShadowManager:
 
         if cloned.spec:
             # Remove fields rejected on create in shadow clusters.
-            api_client = client.ApiClient()
-            spec_dict = api_client.sanitize_for_serialization(cloned.spec)
+            spec_dict = self._host_api_client.sanitize_for_serialization(cloned.spec)
             spec_dict.pop("clusterIP", None)
             spec_dict.pop("clusterIPs", None)
             spec_dict["type"] = "ClusterIP"
@@ -2922,7 +2980,9 @@ class ShadowManager:
             spec_dict.pop("allocateLoadBalancerNodePorts", None)
             for port in spec_dict.get("ports", []):
                 port.pop("nodePort", None)
-            cloned.spec = api_client._ApiClient__deserialize(spec_dict, "V1ServiceSpec")
+            cloned.spec = self._host_api_client._ApiClient__deserialize(
+                spec_dict, "V1ServiceSpec"
+            )
 
         try:
             await self._call_api(
@@ -3090,6 +3150,9 @@ class ShadowManager:
         if not changes:
             return
 
+        # Changes may swap container images; drop any previously resolved set.
+        self._image_cache.pop(env.id, None)
+
         manifests = changes.get("manifests")
         if manifests:
             valid_manifests = self._normalize_manifests(manifests)
@@ -3815,19 +3878,23 @@ class ShadowManager:
                 log.error("pod_diagnostics_no_kubeconfig", shadow_id=env.id)
                 return
 
-            # Load shadow cluster client
-            shadow_config = client.Configuration()
-            config.load_kube_config(
-                client_configuration=shadow_config, config_file=env.kubeconfig_path
-            )
-            shadow_config.verify_ssl = False
-            core_api = client.CoreV1Api(client.ApiClient(shadow_config))
+            # Reuse the pooled shadow client when available; build one only as a fallback.
+            cached = self._shadow_clients.get(env.id)
+            if cached:
+                core_api = cached.core
+            else:
+                shadow_config = client.Configuration()
+                config.load_kube_config(
+                    client_configuration=shadow_config, config_file=env.kubeconfig_path
+                )
+                shadow_config.verify_ssl = False
+                core_api = client.CoreV1Api(client.ApiClient(shadow_config))
 
             # List pods for the deployment
             pods = await self._call_api(
                 core_api.list_namespaced_pod,
                 env.namespace,
-                label_selector=f"app={env.source_resource}",
+                label_selector=env.app_label_selector,
             )
 
             if not pods or not pods.items:
@@ -4131,6 +4198,48 @@ class ShadowManager:
             target_url=f"{fallback_base}{path}",
         )
 
+    @staticmethod
+    def _build_test_job(
+        *,
+        job_name: str,
+        env: ShadowEnvironment,
+        test_type: str,
+        image: str,
+        script: str,
+        active_deadline_seconds: int,
+        env_vars: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Build a verification Job manifest as a plain dict.
+
+        The API accepts dict bodies directly, which avoids constructing a tree of
+        client model objects for every test Job.
+        """
+        container: dict[str, Any] = {
+            "name": test_type,
+            "image": image,
+            "command": ["/bin/sh", "-c", script],
+        }
+        if env_vars:
+            container["env"] = [{"name": key, "value": value} for key, value in env_vars.items()]
+        return {
+            "apiVersion": "batch/v1",
+            "kind": "Job",
+            "metadata": {
+                "name": job_name,
+                "namespace": env.namespace,
+                "labels": {"aegis.io/test": test_type, SHADOW_ID_LABEL: env.id},
+            },
+            "spec": {
+                "backoffLimit": 0,
+                "ttlSecondsAfterFinished": 300,
+                "activeDeadlineSeconds": active_deadline_seconds,
+                "template": {
+                    "metadata": {"labels": {"aegis.io/test": test_type}},
+                    "spec": {"restartPolicy": "Never", "containers": [container]},
+                },
+            },
+        }
+
     async def _run_smoke_test(
         self,
         env: ShadowEnvironment,
@@ -4141,44 +4250,14 @@ class ShadowManager:
     ) -> dict[str, Any]:
         job_name = self._build_job_name("aegis-smoke", env.id)
         smoke_paths = " ".join(paths)
-        script = (
-            "set -e\n"
-            "for path in $SMOKE_PATHS; do\n"
-            '  echo "SMOKE_CHECK ${path}"\n'
-            f"  curl -fsS --connect-timeout {CURL_CONNECT_TIMEOUT_SECONDS} "
-            f'--max-time {CURL_MAX_TIME_SECONDS} "${{TARGET_BASE}}${{path}}" >/dev/null\n'
-            "done\n"
-            'echo "SMOKE_OK"\n'
-        )
-
-        job = client.V1Job(
-            metadata=client.V1ObjectMeta(
-                name=job_name,
-                namespace=env.namespace,
-                labels={"aegis.io/test": "smoke", "aegis.io/shadow-id": env.id},
-            ),
-            spec=client.V1JobSpec(
-                backoff_limit=0,
-                ttl_seconds_after_finished=300,
-                active_deadline_seconds=JOB_ACTIVE_DEADLINE_SECONDS,
-                template=client.V1PodTemplateSpec(
-                    metadata=client.V1ObjectMeta(labels={"aegis.io/test": "smoke"}),
-                    spec=client.V1PodSpec(
-                        restart_policy="Never",
-                        containers=[
-                            client.V1Container(
-                                name="smoke",
-                                image=SMOKE_TEST_IMAGE,
-                                command=["/bin/sh", "-c", script],
-                                env=[
-                                    client.V1EnvVar(name="TARGET_BASE", value=target_base),
-                                    client.V1EnvVar(name="SMOKE_PATHS", value=smoke_paths),
-                                ],
-                            )
-                        ],
-                    ),
-                ),
-            ),
+        job = self._build_test_job(
+            job_name=job_name,
+            env=env,
+            test_type="smoke",
+            image=SMOKE_TEST_IMAGE,
+            script=SMOKE_TEST_SCRIPT,
+            active_deadline_seconds=JOB_ACTIVE_DEADLINE_SECONDS,
+            env_vars={"TARGET_BASE": target_base, "SMOKE_PATHS": smoke_paths},
         )
 
         start = time.monotonic()
@@ -4189,7 +4268,9 @@ class ShadowManager:
             passed = await self._wait_for_job(
                 job_name, env.namespace, batch_api, SMOKE_TEST_TIMEOUT_SECONDS
             )
-            logs = await self._get_job_logs(job_name, env.namespace, core_api)
+            logs = (await self._get_job_logs(job_name, env.namespace, core_api)).decode(
+                "utf-8", "replace"
+            )
         except (ApiException, RuntimeError) as exc:
             logs = f"Smoke test error: {exc}"
             log.warning("shadow_smoke_test_failed", shadow_id=env.id, error=str(exc))
@@ -4230,51 +4311,21 @@ class ShadowManager:
         base = f"{parsed.scheme}://{parsed.netloc}" if parsed.scheme else config.target_url
         path = parsed.path or "/"
 
-        locustfile = "\n".join(
-            [
-                "from locust import HttpUser, task, between",
-                "",
-                "class AegisUser(HttpUser):",
-                "    wait_time = between(0.1, 0.5)",
-                "",
-                "    @task",
-                "    def hit(self):",
-                f'        self.client.get("{path}", timeout={settings.loadtest.timeout})',
-            ]
-        )
-        command = (
-            "cat << 'PY' > /tmp/locustfile.py\n"
-            f"{locustfile}\n"
-            "PY\n"
-            f"locust -f /tmp/locustfile.py --headless "
-            f"-u {config.users} -r {config.spawn_rate} -t {config.duration_seconds}s "
-            f"--host {base}\n"
+        command = LOAD_TEST_COMMAND_TEMPLATE.format(
+            locustfile=LOCUSTFILE_TEMPLATE.format(path=path, timeout=settings.loadtest.timeout),
+            users=config.users,
+            spawn_rate=config.spawn_rate,
+            duration=config.duration_seconds,
+            host=base,
         )
 
-        job = client.V1Job(
-            metadata=client.V1ObjectMeta(
-                name=job_name,
-                namespace=env.namespace,
-                labels={"aegis.io/test": "load", "aegis.io/shadow-id": env.id},
-            ),
-            spec=client.V1JobSpec(
-                backoff_limit=0,
-                ttl_seconds_after_finished=300,
-                active_deadline_seconds=config.duration_seconds + 60,
-                template=client.V1PodTemplateSpec(
-                    metadata=client.V1ObjectMeta(labels={"aegis.io/test": "load"}),
-                    spec=client.V1PodSpec(
-                        restart_policy="Never",
-                        containers=[
-                            client.V1Container(
-                                name="load",
-                                image=LOAD_TEST_IMAGE,
-                                command=["/bin/sh", "-c", command],
-                            )
-                        ],
-                    ),
-                ),
-            ),
+        job = self._build_test_job(
+            job_name=job_name,
+            env=env,
+            test_type="load",
+            image=LOAD_TEST_IMAGE,
+            script=command,
+            active_deadline_seconds=config.duration_seconds + 60,
         )
 
         start = time.monotonic()
@@ -4289,8 +4340,9 @@ class ShadowManager:
                 batch_api,
                 config.duration_seconds + 90,
             )
-            logs = await self._get_job_logs(job_name, env.namespace, core_api)
-            failure_rate = self._parse_locust_failure_rate(logs)
+            raw_logs = await self._get_job_logs(job_name, env.namespace, core_api)
+            failure_rate = self._parse_locust_failure_rate(raw_logs)
+            logs = raw_logs.decode("utf-8", "replace")
             if failure_rate is not None:
                 success_rate = 1.0 - failure_rate
                 passed = job_ok and success_rate >= settings.loadtest.success_threshold
@@ -4332,54 +4384,92 @@ class ShadowManager:
         apps_api: client.AppsV1Api,
         core_api: client.CoreV1Api,
     ) -> list[str]:
-        """Resolve container images for the workload under verification."""
-        kind = env.source_resource_kind.lower()
-        images: list[str] = []
+        """Resolve container images for the workload under verification.
 
+        Results are memoized per shadow until changes are applied or the shadow is
+        cleaned up, so repeated verification phases issue a single API read. Failed
+        or empty lookups are not kept, so the next caller reads the spec again.
+        """
+        task = self._image_cache.get(env.id)
+        if task is None or task.cancelled():
+            task = asyncio.ensure_future(
+                self._fetch_images_for_resource(env, apps_api=apps_api, core_api=core_api)
+            )
+            self._image_cache[env.id] = task
         try:
-            if kind == "deployment":
-                deployment = await self._call_api(
-                    apps_api.read_namespaced_deployment, env.source_resource, env.namespace
-                )
-                images = self._extract_images_from_pod_spec(
-                    deployment.spec.template.spec if deployment.spec else None
-                )
-            elif kind == "statefulset":
-                statefulset = await self._call_api(
-                    apps_api.read_namespaced_stateful_set, env.source_resource, env.namespace
-                )
-                images = self._extract_images_from_pod_spec(
-                    statefulset.spec.template.spec if statefulset.spec else None
-                )
-            elif kind == "daemonset":
-                daemonset = await self._call_api(
-                    apps_api.read_namespaced_daemon_set, env.source_resource, env.namespace
-                )
-                images = self._extract_images_from_pod_spec(
-                    daemonset.spec.template.spec if daemonset.spec else None
-                )
-            elif kind == "replicaset":
-                replicaset = await self._call_api(
-                    apps_api.read_namespaced_replica_set, env.source_resource, env.namespace
-                )
-                images = self._extract_images_from_pod_spec(
-                    replicaset.spec.template.spec if replicaset.spec else None
-                )
-            elif kind == "pod":
-                pod = await self._call_api(
-                    core_api.read_namespaced_pod, env.source_resource, env.namespace
-                )
-                images = self._extract_images_from_pod_spec(pod.spec if pod else None)
-            else:
-                pods = await self._call_api(
-                    core_api.list_namespaced_pod,
-                    env.namespace,
-                    label_selector=f"aegis.io/shadow-id={env.id}",
-                )
-                for pod in pods.items:
-                    images.extend(self._extract_images_from_pod_spec(pod.spec if pod else None))
+            images = list(await task)
         except ApiException as exc:
+            self._evict_image_cache(env.id, task)
             log.warning("shadow_image_resolution_failed", shadow_id=env.id, error=str(exc))
+            return []
+        except Exception:
+            self._evict_image_cache(env.id, task)
+            raise
+        if not images:
+            self._evict_image_cache(env.id, task)
+        return images
+
+    def _evict_image_cache(self, shadow_id: str, task: asyncio.Task[list[str]]) -> None:
+        """Drop a cached image lookup unless a newer one has replaced it."""
+        if self._image_cache.get(shadow_id) is task:
+            del self._image_cache[shadow_id]
+
+    async def _fetch_images_for_resource(
+        self,
+        env: ShadowEnvironment,
+        *,
+        apps_api: client.AppsV1Api,
+        core_api: client.CoreV1Api,
+    ) -> list[str]:
+        """Read the workload spec from the shadow API and collect its images.
+
+        Raises:
+            ApiException: If the workload or its pods cannot be read.
+        """
+        kind = env.source_resource_kind.lower()
+        images: list[str] = []
+
+        if kind == "deployment":
+            deployment = await self._call_api(
+                apps_api.read_namespaced_deployment, env.source_resource, env.namespace
+            )
+            images = self._extract_images_from_pod_spec(
+                deployment.spec.template.spec if deployment.spec else None
+            )
+        elif kind == "statefulset":
+            statefulset = await self._call_api(
+                apps_api.read_namespaced_stateful_set, env.source_resource, env.namespace
+            )
+            images = self._extract_images_from_pod_spec(
+                statefulset.spec.template.spec if statefulset.spec else None
+            )
+        elif kind == "daemonset":
+            daemonset = await self._call_api(
+                apps_api.read_namespaced_daemon_set, env.source_resource, env.namespace
+            )
+            images = self._extract_images_from_pod_spec(
+                daemonset.spec.template.spec if daemonset.spec else None
+            )
+        elif kind == "replicaset":
+            replicaset = await self._call_api(
+                apps_api.read_namespaced_replica_set, env.source_resource, env.namespace
+            )
+            images = self._extract_images_from_pod_spec(
+                replicaset.spec.template.spec if replicaset.spec else None
+            )
+        elif kind == "pod":
+            pod = await self._call_api(
+                core_api.read_namespaced_pod, env.source_resource, env.namespace
+            )
+            images = self._extract_images_from_pod_spec(pod.spec if pod else None)
+        else:
+            pods = await self._call_api(
+                core_api.list_namespaced_pod,
+                env.namespace,
+                label_selector=env.shadow_label_selector,
+            )
+            for pod in pods.items:
+                images.extend(self._extract_images_from_pod_spec(pod.spec if pod else None))
 
         return sorted({image for image in images if image})
 
@@ -4400,8 +4490,48 @@ class ShadowManager:
         batch_api: client.BatchV1Api,
         timeout_seconds: int,
     ) -> bool:
-        """Wait for a Kubernetes Job to complete."""
+        """Wait for a Kubernetes Job to complete.
+
+        Watches the Job server-side in slices of at most ``JOB_WATCH_SLICE_SECONDS``
+        (each slice re-lists the Job, so no events are missed between slices);
+        falls back to polling if the watch cannot be established. Watches run on
+        the manager's dedicated job-watch pool rather than the default executor.
+        """
         start = time.monotonic()
+        loop = asyncio.get_running_loop()
+
+        def _watch_job(slice_seconds: int) -> bool | None:
+            job_watch = watch.Watch()
+            try:
+                for event in job_watch.stream(
+                    batch_api.list_namespaced_job,
+                    namespace,
+                    field_selector=f"metadata.name={job_name}",
+                    timeout_seconds=slice_seconds,
+                    _request_timeout=slice_seconds + JOB_WATCH_REQUEST_SLACK_SECONDS,
+                ):
+                    status = event["object"].status
+                    if status and status.succeeded and status.succeeded >= 1:
+                        return True
+                    if status and status.failed and status.failed >= 1:
+                        return False
+            finally:
+                job_watch.stop()
+            return None
+
+        try:
+            while (remaining := timeout_seconds - (time.monotonic() - start)) > 0:
+                slice_seconds = max(1, math.ceil(min(remaining, JOB_WATCH_SLICE_SECONDS)))
+                outcome = await loop.run_in_executor(
+                    self._job_watch_executor, _watch_job, slice_seconds
+                )
+                if outcome is not None:
+                    return outcome
+        except (ApiException, urllib3.exceptions.HTTPError) as exc:
+            log.debug("shadow_job_watch_failed", job=job_name, error=str(exc))
+        else:
+            return False
+
         while time.monotonic() - start < timeout_seconds:
             job = cast(
                 client.V1Job,
@@ -4420,42 +4550,63 @@ class ShadowManager:
         job_name: str,
         namespace: str,
         core_api: client.CoreV1Api,
-    ) -> str:
-        """Fetch logs from the first pod of a job."""
+    ) -> bytes:
+        """Fetch raw log bytes from the first pod of a job."""
         pods = cast(
             client.V1PodList,
             await self._call_api(
                 core_api.list_namespaced_pod,
                 namespace,
-                label_selector=f"job-name={job_name}",
+                label_selector=ShadowEnvironment.job_label_selector(job_name),
             ),
         )
         if not pods.items:
-            return ""
+            return b""
         pod_name = pods.items[0].metadata.name if pods.items[0].metadata else None
         if not pod_name:
-            return ""
+            return b""
+
+        def _read_raw_log() -> bytes:
+            # Skip client-side decoding/deserialization of potentially large logs.
+            response = core_api.read_namespaced_pod_log(pod_name, namespace, _preload_content=False)
+            try:
+                return bytes(response.data or b"")
+            finally:
+                response.release_conn()
+
         try:
-            logs = await self._call_api(core_api.read_namespaced_pod_log, pod_name, namespace)
+            return cast(bytes, await self._call_api(_read_raw_log))
         except ApiException:
-            return ""
-        return str(logs) if logs is not None else ""
+            return b""
 
     @staticmethod
-    def _parse_locust_failure_rate(logs: str) -> float | None:
-        """Parse Locust failure rate from logs."""
-        for line in logs.splitlines():
-            if line.strip().startswith("Aggregated"):
-                match = re.search(r"\((\d+\.?\d*)%\)", line)
-                if match:
-                    return float(match.group(1)) / 100.0
+    def _parse_locust_failure_rate(logs: bytes) -> float | None:
+        """Parse the final Locust aggregated failure rate from raw job logs.
+
+        Only the `Aggregated` stats lines are decoded, scanning backwards so the
+        end-of-run summary wins over intermediate stats reports.
+        """
+        end = len(logs)
+        while (idx := logs.rfind(b"Aggregated", 0, end)) != -1:
+            line_end = logs.find(b"\n", idx)
+            line = logs[idx : line_end if line_end != -1 else len(logs)]
+            match = LOCUST_FAILURE_RATE_RE.search(line.decode("utf-8", "replace"))
+            if match:
+                return float(match.group(1)) / 100.0
+            end = idx
         return None
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _sanitized_job_prefix(prefix: str) -> str:
+        """Sanitize a (constant) job name prefix once."""
+        return ShadowManager._sanitize_name(prefix)
+
     @classmethod
     def _build_job_name(cls, prefix: str, shadow_id: str) -> str:
         """Build a DNS-safe job name within the length limit."""
-        raw = f"{prefix}-{shadow_id}-{int(time.time())}"
-        name = cls._sanitize_name(raw)
+        suffix = cls._sanitize_name(f"{shadow_id}-{int(time.time())}")
+        name = f"{cls._sanitized_job_prefix(prefix)}-{suffix}"
         return name[:K8S_NAME_MAX_LENGTH].rstrip("-")
 
     async def _monitor_health(
@@ -4507,7 +4658,7 @@ class ShadowManager:
                     )
             elif source_kind in {"deployment", "pod", "statefulset", "daemonset", "replicaset"}:
                 # Most demo manifests use `app=<resource-name>` for workload identity.
-                label_selector = f"app={env.source_resource}"
+                label_selector = env.app_label_selector
 
             pods = cast(
                 client.V1PodList,
@@ -4548,20 +4699,13 @@ class ShadowManager:
             if not candidate_pods:
                 return 0.0
 
-            healthy = 0
-            for pod in candidate_pods:
-                if not pod.status:
-                    continue
-                if pod.status.phase != "Running":
-                    continue
-                ready = True
-                for cs in pod.status.container_statuses or []:
-                    if not cs.ready:
-                        ready = False
-                        break
-                if ready:
-                    healthy += 1
-
+            healthy = sum(
+                1
+                for pod in candidate_pods
+                if pod.status
+                and pod.status.phase == "Running"
+                and all(cs.ready for cs in pod.status.container_statuses or ())
+            )
             return healthy / len(candidate_pods)
 
         except ApiException:
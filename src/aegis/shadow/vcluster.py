@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import os
 import shutil
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -14,6 +17,14 @@ from aegis.shadow.errors import ShadowWorkflowError
 
 log = get_logger(__name__)
 
+# Upper bound for a single vcluster CLI invocation (create can take a few minutes).
+VCLUSTER_CLI_TIMEOUT_SECONDS = 300
+# Tighter bounds for the short-lived subcommands.
+VCLUSTER_CONNECT_TIMEOUT_SECONDS = 60
+VCLUSTER_DELETE_TIMEOUT_SECONDS = 120
+# Pipe read size used when draining vcluster CLI output.
+VCLUSTER_STREAM_CHUNK_BYTES = 64 * 1024
+
 
 @dataclass(frozen=True)
 class VClusterResult:
@@ -24,6 +35,27 @@ class VClusterResult:
     returncode: int
 
 
+@functools.lru_cache(maxsize=4)
+def _locate_vcluster(search_path: str) -> str | None:
+    """Resolve the vcluster binary, memoized per PATH value."""
+    return shutil.which("vcluster", path=search_path or None)
+
+
+def invalidate_cli_cache() -> None:
+    """Forget memoized vcluster binary lookups (e.g. after installing the CLI)."""
+    _locate_vcluster.cache_clear()
+
+
+async def _read_stream(stream: asyncio.StreamReader | None) -> bytes:
+    """Drain a subprocess pipe in bounded chunks."""
+    if stream is None:
+        return b""
+    chunks: list[bytes] = []
+    while chunk := await stream.read(VCLUSTER_STREAM_CHUNK_BYTES):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 class VClusterManager:
     """Thin wrapper around the vCluster CLI."""
 
@@ -33,11 +65,23 @@ class VClusterManager:
         *,
         kubeconfig_path: str | Path | None = None,
         context: str | None = None,
+        timeout_s: float | None = None,
     ) -> None:
         self.template_path = Path(template_path) if template_path else None
         self.kubeconfig_path = self._normalize_kubeconfig_path(kubeconfig_path)
         self.context = context.strip() if context and context.strip() else None
-        self.cli_path = shutil.which("vcluster")
+        self.cli_path = _locate_vcluster(os.environ.get("PATH", ""))
+        # argv fragments shared by every invocation, resolved once
+        self._cli = self.cli_path or "vcluster"
+        self._template_args: tuple[str, ...] = (
+            ("-f", str(self.template_path))
+            if self.template_path and self.template_path.exists()
+            else ()
+        )
+        self._global_flags: tuple[str, ...] = ("--context", self.context) if self.context else ()
+        self._env_cache: tuple[str | None, dict[str, str]] | None = None
+        # Optional override applied to every CLI invocation
+        self.timeout_s = timeout_s
 
     def is_installed(self) -> bool:
         """Check if vcluster binary is available."""
@@ -55,38 +99,65 @@ class VClusterManager:
         normalized = str(expanded).strip()
         return normalized or None
 
-    def _apply_global_flags(self, cmd: list[str]) -> list[str]:
-        """Apply global vcluster CLI flags for deterministic cluster selection."""
-        command = list(cmd)
-        if self.context:
-            command.extend(["--context", self.context])
-        return command
-
-    def _run(self, args: list[str]) -> VClusterResult:
-        """Run vcluster command and return result."""
-        return asyncio.run(self._run_async(args))
-
-    async def _run_async(self, args: list[str]) -> VClusterResult:
-        """Run vcluster command asynchronously and return result."""
+    def _subprocess_env(self) -> dict[str, str]:
+        """Return the CLI environment, rebuilt only when the kubeconfig path changes."""
+        cached = self._env_cache
+        if cached is not None and cached[0] == self.kubeconfig_path:
+            return cached[1]
         # Pass current environment to subprocess to ensure KUBECONFIG is inherited
         env = os.environ.copy()
         if self.kubeconfig_path:
             env["KUBECONFIG"] = self.kubeconfig_path
+        self._env_cache = (self.kubeconfig_path, env)
+        return env
+
+    async def _run_async(self, args: list[str], budget_s: float) -> VClusterResult:
+        """Run vcluster command asynchronously and return result.
 
+        ``budget_s`` is the per-operation time limit; ``self.timeout_s`` overrides it.
+        """
+        timeout = self.timeout_s if self.timeout_s is not None else budget_s
         process = await asyncio.create_subprocess_exec(
             *args,
+            # Never let the CLI block on an interactive prompt
+            stdin=asyncio.subprocess.DEVNULL,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
-            env=env,
+            env=self._subprocess_env(),
         )
-        stdout, stderr = await process.communicate()
+
+        async def _collect() -> tuple[bytes, bytes]:
+            out, err = await asyncio.gather(
+                _read_stream(process.stdout), _read_stream(process.stderr)
+            )
+            await process.wait()
+            return out, err
+
+        try:
+            stdout, stderr = await asyncio.wait_for(_collect(), timeout=timeout)
+        except TimeoutError as exc:
+            # The CLI may exit between the timeout firing and the kill
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+            raise ShadowWorkflowError(
+                code="vcluster_cli_timeout",
+                phase="vcluster_cli",
+                message=f"vcluster CLI timed out after {timeout}s",
+                retryable=True,
+                details={
+                    "command": args[1] if len(args) > 1 else None,
+                    "timeout_seconds": timeout,
+                },
+            ) from exc
+
         return VClusterResult(
-            stdout=stdout.decode(errors="replace").strip() if stdout else "",
-            stderr=stderr.decode(errors="replace").strip() if stderr else "",
+            stdout=stdout.decode("utf-8", "replace").strip(),
+            stderr=stderr.decode("utf-8", "replace").strip(),
             returncode=process.returncode or 0,
         )
 
-    def create(self, name: str, namespace: str) -> VClusterResult:
+    async def create(self, name: str, namespace: str) -> VClusterResult:
         """Create a vCluster with external exposure for operator access."""
         if not self.is_installed():
             raise ShadowWorkflowError(
@@ -98,24 +169,21 @@ class VClusterManager:
 
         # 2026 Fix: Use --expose to create a LoadBalancer/NodePort
         # This allows the operator (external to cluster) to reach the vCluster API
+        # We handle connection manually via 'connect --print'
         cmd = [
-            self.cli_path or "vcluster",
+            self._cli,
             "create",
             name,
             "--namespace",
             namespace,
             "--expose",
+            *self._template_args,
+            "--connect=false",
+            *self._global_flags,
         ]
 
-        if self.template_path and self.template_path.exists():
-            cmd.extend(["-f", str(self.template_path)])
-
-        # We handle connection manually via 'connect --print'
-        cmd.append("--connect=false")
-        cmd = self._apply_global_flags(cmd)
-
         log.info(f"Creating vCluster: {' '.join(cmd)}")
-        result = self._run(cmd)
+        result = await self._run_async(cmd, VCLUSTER_CLI_TIMEOUT_SECONDS)
 
         if result.returncode != 0:
             log.error(
@@ -140,7 +208,7 @@ class VClusterManager:
 
         return result
 
-    def get_kubeconfig(self, name: str, namespace: str) -> str:
+    async def get_kubeconfig(self, name: str, namespace: str) -> str:
         """Get kubeconfig for a vCluster via `vcluster connect --print`."""
         if not self.is_installed():
             raise ShadowWorkflowError(
@@ -154,16 +222,16 @@ class VClusterManager:
         # The --server argument is often not needed if --expose set up the LB correctly,
         # but we must ensure we don't get a localhost config.
         cmd = [
-            self.cli_path or "vcluster",
+            self._cli,
             "connect",
             name,
             "--namespace",
             namespace,
             "--print",
             "--silent",  # Suppress logs in stdout, we only want the yaml
+            *self._global_flags,
         ]
-        cmd = self._apply_global_flags(cmd)
-        result = self._run(cmd)
+        result = await self._run_async(cmd, VCLUSTER_CONNECT_TIMEOUT_SECONDS)
         if result.returncode != 0:
             log.error(
                 "vcluster_kubeconfig_failed",
@@ -199,7 +267,7 @@ class VClusterManager:
         # However, --expose should return the LB IP.
         return result.stdout
 
-    def delete(self, name: str, namespace: str) -> VClusterResult:
+    async def delete(self, name: str, namespace: str) -> VClusterResult:
         if not self.is_installed():
             raise ShadowWorkflowError(
                 code="vcluster_cli_missing",
@@ -208,9 +276,8 @@ class VClusterManager:
                 retryable=False,
             )
 
-        cmd = [self.cli_path or "vcluster", "delete", name, "--namespace", namespace]
-        cmd = self._apply_global_flags(cmd)
-        result = self._run(cmd)
+        cmd = [self._cli, "delete", name, "--namespace", namespace, *self._global_flags]
+        result = await self._run_async(cmd, VCLUSTER_DELETE_TIMEOUT_SECONDS)
         if result.returncode != 0:
             raise ShadowWorkflowError(
                 code="vcluster_delete_failed",
@@ -227,5 +294,46 @@ class VClusterManager:
             )
         return result
 
+    async def create_many(
+        self, specs: Iterable[tuple[str, str]]
+    ) -> list[VClusterResult | BaseException]:
+        """Create several vClusters concurrently from (name, namespace) pairs.
+
+        Returns one outcome per spec, in order: the result, or the exception that
+        item raised. A failure never abandons the other in-flight creates.
+        """
+        return await self._run_many("create", self.create, specs)
+
+    async def delete_many(
+        self, specs: Iterable[tuple[str, str]]
+    ) -> list[VClusterResult | BaseException]:
+        """Delete several vClusters concurrently from (name, namespace) pairs.
 
-__all__ = ["VClusterManager", "VClusterResult"]
+        Returns one outcome per spec, in order, like :meth:`create_many`.
+        """
+        return await self._run_many("delete", self.delete, specs)
+
+    @staticmethod
+    async def _run_many(
+        operation: str,
+        func: Callable[[str, str], Awaitable[VClusterResult]],
+        specs: Iterable[tuple[str, str]],
+    ) -> list[VClusterResult | BaseException]:
+        """Run ``func`` for every spec and wait for all of them, collecting failures."""
+        pairs = list(specs)
+        outcomes = await asyncio.gather(
+            *(func(name, ns) for name, ns in pairs), return_exceptions=True
+        )
+        for (name, namespace), outcome in zip(pairs, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                log.error(
+                    "vcluster_batch_item_failed",
+                    operation=operation,
+                    name=name,
+                    namespace=namespace,
+                    error=str(outcome),
+                )
+        return list(outcomes)
+
+
+__all__ = ["VClusterManager", "VClusterResult", "invalidate_cli_cache"]
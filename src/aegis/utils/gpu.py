@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
 from typing import Any
 
+import urllib3
 from kubernetes import client
 from kubernetes import config as k8s_config
 
@@ -17,10 +22,91 @@ GPU_RESOURCE_KEYS = (
     "nvidia.com/gpu",
     "amd.com/gpu",
 )
+_GPU_KEYS = frozenset(GPU_RESOURCE_KEYS)
+_ZERO_QUANTITIES = frozenset({"0", "0m", 0, None})
+GPU_NODE_LIST_PAGE_SIZE = 500
+GPU_NODE_LIST_TIMEOUT_SECONDS = 5
+
+
+class _GPUNodeCache:
+    """Holder for the last GPU node detection result to avoid global statement."""
+
+    expires_at: float = 0.0
+    kubeconfig_mtime: float | None = None
+    nodes: list[str] | None = None
+
+
+def _kubeconfig_mtime() -> float | None:
+    """Return the mtime of the kubeconfig in use, or None (in-cluster / missing)."""
+    if settings.kubernetes.in_cluster:
+        return None
+    path = settings.kubernetes.kubeconfig_path or os.environ.get("KUBECONFIG", "~/.kube/config")
+    try:
+        return Path(path.split(os.pathsep)[0]).expanduser().stat().st_mtime
+    except OSError:
+        return None
+
+
+def _remember_gpu_nodes(nodes: list[str], ttl_seconds: float) -> list[str]:
+    _GPUNodeCache.nodes = nodes
+    _GPUNodeCache.kubeconfig_mtime = _kubeconfig_mtime()
+    _GPUNodeCache.expires_at = time.monotonic() + ttl_seconds
+    return list(nodes)
+
+
+def clear_gpu_node_cache() -> None:
+    """Drop the cached GPU node detection result."""
+    _GPUNodeCache.nodes = None
+    _GPUNodeCache.kubeconfig_mtime = None
+    _GPUNodeCache.expires_at = 0.0
+
+
+def _iter_nodes(core_api: client.CoreV1Api) -> Iterator[Any]:
+    """Yield nodes page by page."""
+    kwargs: dict[str, Any] = {
+        "limit": GPU_NODE_LIST_PAGE_SIZE,
+        "_request_timeout": GPU_NODE_LIST_TIMEOUT_SECONDS,
+    }
+    while True:
+        page = core_api.list_node(**kwargs)
+        yield from page.items or []
+        continue_token = page.metadata._continue if page.metadata else None
+        if not continue_token:
+            return
+        kwargs["_continue"] = continue_token
+
+
+def _gpu_node_names(nodes: Iterable[Any]) -> list[str]:
+    """Return names of nodes with non-zero allocatable GPU resources."""
+    gpu_nodes: list[str] = []
+    for node in nodes:
+        allocatable: dict[str, Any] = (node.status.allocatable if node.status else None) or {}
+        if (
+            node.metadata
+            and node.metadata.name
+            and any(
+                allocatable[key] not in _ZERO_QUANTITIES for key in _GPU_KEYS & allocatable.keys()
+            )
+        ):
+            gpu_nodes.append(node.metadata.name)
+    return gpu_nodes
 
 
 def detect_gpu_nodes() -> list[str]:
-    """Return names of nodes advertising GPU resources."""
+    """Return names of nodes advertising GPU resources.
+
+    Results (including "no GPU nodes") are cached for
+    ``settings.gpu.node_cache_ttl_seconds``; a missing kubeconfig is remembered for
+    the longer ``settings.gpu.unavailable_cache_ttl_seconds``. Editing the kubeconfig
+    invalidates the cache early.
+    """
+    if (
+        _GPUNodeCache.nodes is not None
+        and time.monotonic() < _GPUNodeCache.expires_at
+        and _kubeconfig_mtime() == _GPUNodeCache.kubeconfig_mtime
+    ):
+        return list(_GPUNodeCache.nodes)
+
     try:
         if settings.kubernetes.in_cluster:
             k8s_config.load_incluster_config()
@@ -31,27 +117,19 @@ def detect_gpu_nodes() -> list[str]:
             )
     except k8s_config.ConfigException as exc:
         log.debug("gpu_kubeconfig_unavailable", error=str(exc))
-        return []
+        return _remember_gpu_nodes([], settings.gpu.unavailable_cache_ttl_seconds)
 
     core_api = client.CoreV1Api()
     try:
-        nodes = core_api.list_node()
-    except client.ApiException as exc:
-        log.debug("gpu_node_list_failed", error=exc.reason)
+        # Allocatable resources are the source of truth: GPU feature discovery labels
+        # only cover NVIDIA nodes and may be missing on part of the fleet.
+        gpu_nodes = _gpu_node_names(_iter_nodes(core_api))
+    except (client.ApiException, urllib3.exceptions.HTTPError) as exc:
+        # HTTPError covers _request_timeout expiry and connection failures.
+        log.debug("gpu_node_list_failed", error=str(exc))
         return []
 
-    gpu_nodes: list[str] = []
-    for node in nodes.items:
-        allocatable: dict[str, Any] = node.status.allocatable or {}
-        if (
-            node.metadata
-            and node.metadata.name
-            and any(
-                key in allocatable and allocatable[key] not in ("0", 0) for key in GPU_RESOURCE_KEYS
-            )
-        ):
-            gpu_nodes.append(node.metadata.name)
-    return gpu_nodes
+    return _remember_gpu_nodes(gpu_nodes, settings.gpu.node_cache_ttl_seconds)
 
 
 def detect_gpu_available() -> bool:
@@ -59,4 +137,4 @@ def detect_gpu_available() -> bool:
     return bool(detect_gpu_nodes())
 
 
-__all__ = ["detect_gpu_available", "detect_gpu_nodes"]
+__all__ = ["clear_gpu_node_cache", "detect_gpu_available", "detect_gpu_nodes"]